@@ -1,24 +1,263 @@
 """API client for Plano Water portal."""
 from __future__ import annotations
 
-import json
 import logging
 import re
+import time
 from datetime import datetime, timedelta
+from html import unescape as html_unescape
 from typing import Any
 
 import aiohttp
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from .const import (
     ACCOUNT_SUMMARY_URL,
     BASE_URL,
     DEFAULT_TIMEOUT,
+    LOGIN_REFRESH_INTERVAL,
     LOGIN_URL,
+    REQUEST_HEADERS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Raw page bytes go straight to libxml2, which decodes them as UTF-8 itself
+_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+# Compiled once at import; evaluated against the AccountSummary page on every update
+_USAGE_SPAN_XPATH = etree.XPath('//span[@id="MainContent_lblReadDateTime"]')
+
+# Fast path for the usage table: a fixed 3-column row of plain-text cells
+_USAGE_SPAN_MARKER = b'id="MainContent_lblReadDateTime"'
+_USAGE_ROW_RE = re.compile(
+    rb"<tr[^>]*>\s*<td[^>]*>([^<]*)</td>\s*<td[^>]*>([^<]*)</td>\s*<td[^>]*>([^<]*)</td>",
+    re.IGNORECASE,
+)
+
+# Account summary span and the currently selected meter
+_ACCOUNT_SPAN_XPATH = etree.XPath('//span[@id="MainContent_lblAccountSummary"]')
+_SELECTED_METER_XPATH = etree.XPath('//select[@id="MainContent_ddMeters"]/option[@selected]')
+
+# Labels inside the MainContent_lblAccountSummary span
+_ACCOUNT_NUMBER_RE = re.compile(r"Account Number:\s*(\d+)")
+_NAME_RE = re.compile(r"Name:\s*([^\n]+)")
+_ADDRESS_RE = re.compile(r"Address:\s*([^\n]+)")
+
+# Hidden ASP.NET form fields posted back with the login request
+_ANTIFORGERY_FIELD = "ctl00$MainContent$antiforgery"
+_REQUIRED_LOGIN_FIELDS = ("__VIEWSTATE", "__VIEWSTATEGENERATOR", "__EVENTVALIDATION")
+# Match the whole <input> tag by name, then read value from it, so attribute
+# order doesn't matter
+_LOGIN_FIELD_RES = {
+    field: re.compile(r'<input\b[^>]*\sname="' + re.escape(field) + r'"[^>]*>')
+    for field in (*_REQUIRED_LOGIN_FIELDS, _ANTIFORGERY_FIELD)
+}
+_INPUT_VALUE_RE = re.compile(r'\svalue="([^"]*)"')
+
+
+async def _async_read_html(response: aiohttp.ClientResponse) -> str:
+    """Read a portal response body as text.
+
+    The portal always serves UTF-8, so decode explicitly rather than letting
+    aiohttp sniff the charset when the Content-Type header omits it.
+    """
+    return (await response.read()).decode("utf-8", "replace")
+
+
+def _extract_login_tokens(login_html: str) -> dict[str, str]:
+    """Extract the hidden form tokens from the login page.
+
+    Scans the raw HTML with targeted regexes and only falls back to
+    BeautifulSoup if a required field is missing (page structure changed).
+    """
+    tokens = {}
+    for field, pattern in _LOGIN_FIELD_RES.items():
+        match = pattern.search(login_html)
+        if match:
+            value_match = _INPUT_VALUE_RE.search(match.group(0))
+            if value_match:
+                tokens[field] = html_unescape(value_match.group(1))
+
+    if all(field in tokens for field in _REQUIRED_LOGIN_FIELDS):
+        return tokens
+
+    _LOGGER.debug("Login form tokens not found by regex, falling back to BeautifulSoup")
+    soup = BeautifulSoup(login_html, "lxml")
+    tokens = {
+        field: soup.find("input", {"name": field})["value"]
+        for field in _REQUIRED_LOGIN_FIELDS
+    }
+    antiforgery_input = soup.find("input", {"name": _ANTIFORGERY_FIELD})
+    if antiforgery_input:
+        tokens[_ANTIFORGERY_FIELD] = antiforgery_input["value"]
+    return tokens
+
+
+def _extract_account(doc: lxml_html.HtmlElement) -> dict[str, Any]:
+    """Extract account and meter information from the AccountSummary page."""
+    account_spans = _ACCOUNT_SPAN_XPATH(doc)
+    if not account_spans:
+        return {}
+
+    account_text = account_spans[0].text_content()
+
+    # Parse account number
+    account_match = _ACCOUNT_NUMBER_RE.search(account_text)
+    account_number = account_match.group(1) if account_match else ""
+
+    # Parse name
+    name_match = _NAME_RE.search(account_text)
+    name = name_match.group(1).strip() if name_match else ""
+
+    # Parse address
+    address_match = _ADDRESS_RE.search(account_text)
+    address = address_match.group(1).strip() if address_match else ""
+
+    # Extract meter information
+    meter_id = ""
+    meter_number = ""
+    selected_options = _SELECTED_METER_XPATH(doc)
+    if selected_options:
+        meter_id = selected_options[0].get("value", "")
+        meter_number = selected_options[0].text_content().strip()
+
+    return {
+        "account_number": account_number,
+        "name": name,
+        "address": address,
+        "meter_id": meter_id,
+        "meter_number": meter_number,
+    }
+
+
+def _scan_usage_rows(content: bytes) -> list[tuple[str, str, str]] | None:
+    """Scan the raw usage table for (date, time, usage) cells.
+
+    Returns None if the table can't be located or its cells carry nested
+    markup, in which case the caller falls back to the parsed tree.
+    """
+    span_start = content.find(_USAGE_SPAN_MARKER)
+    if span_start == -1:
+        return None
+
+    # Tag names are case-insensitive; locate structure in a lowercased copy and
+    # slice the original bytes at the same offsets
+    page = content.lower()
+
+    # The table must sit inside the usage span, not somewhere later on the page
+    span_end = page.find(b"</span>", span_start)
+    table_start = page.find(b"<table", span_start, span_end)
+    if span_end == -1 or table_start == -1:
+        return None
+
+    table_end = page.find(b"</table>", table_start)
+    if table_end == -1:
+        return None
+
+    # Same row selection as the tree walk: <tbody> rows, else skip the header row
+    rows_start = page.find(b"<tbody", table_start, table_end)
+    rows_end = table_end
+    if rows_start != -1:
+        tbody_end = page.find(b"</tbody>", rows_start, table_end)
+        if tbody_end != -1:
+            rows_end = tbody_end
+    else:
+        header_start = page.find(b"<tr", table_start, table_end)
+        if header_start == -1:
+            return None
+        rows_start = page.find(b"<tr", header_start + 1, table_end)
+        if rows_start == -1:
+            # Header row only
+            return []
+
+    matches = _USAGE_ROW_RE.findall(content, rows_start, rows_end)
+    # Every <td> must belong to a matched 3-column row
+    if page.count(b"<td", rows_start, rows_end) != 3 * len(matches):
+        return None
+
+    return [
+        tuple(html_unescape(cell.decode("utf-8", "replace")).strip() for cell in match)
+        for match in matches
+    ]
+
+
+def _xpath_usage_rows(doc: lxml_html.HtmlElement) -> list[tuple[str, str, str]] | None:
+    """Walk the parsed usage table for (date, time, usage) cells."""
+    # Find the usage table in the MainContent_lblReadDateTime span
+    usage_spans = _USAGE_SPAN_XPATH(doc)
+    if not usage_spans:
+        _LOGGER.error("Could not find usage data span")
+        return None
+
+    # Find the table within the span
+    table = usage_spans[0].find(".//table")
+    if table is None:
+        _LOGGER.error("Could not find usage table")
+        return None
+
+    # Data rows are the <tbody> rows, or every row after the header without one
+    tbody = table.find(".//tbody")
+    rows = list(tbody.iter("tr")) if tbody is not None else list(table.iter("tr"))[1:]
+
+    usage_rows = []
+    for row in rows:
+        cols = row.findall("td")
+        if len(cols) >= 3:
+            usage_rows.append(tuple(col.text_content().strip() for col in cols[:3]))
+    return usage_rows
+
+
+def _extract_usage(content: bytes, doc: lxml_html.HtmlElement) -> dict[str, Any]:
+    """Extract water usage data from the AccountSummary page."""
+    rows = _scan_usage_rows(content)
+    if rows is None:
+        _LOGGER.debug("Usage table not matched by raw scan, walking parsed tree")
+        rows = _xpath_usage_rows(doc)
+        if rows is None:
+            return {}
+
+    _LOGGER.debug("Found usage table, parsing records")
+    
+    # Parse the usage column in a single pass, keeping only the running sum and
+    # the most recent (first) reading rather than per-row records
+    current_usage = 0
+    daily_usage = 0.0
+    for index, (_, _, usage) in enumerate(rows):
+        # Convert usage to float, handle non-numeric values
+        try:
+            usage_value = float(usage)
+        except ValueError:
+            usage_value = 0.0
+        
+        if index == 0:
+            current_usage = usage_value
+        daily_usage += usage_value
+
+    _LOGGER.info("Parsed %d usage records", len(rows))
+    
+    last_reading = None
+    last_reading_dt = None
+    if rows:
+        date, read_time, _ = rows[0]
+        last_reading = f"{date} {read_time}"
+        # Parse once per update so the sensor doesn't re-parse on every state read
+        try:
+            # Format: "11/26/24 3:00 AM"
+            last_reading_dt = datetime.strptime(last_reading, "%m/%d/%y %I:%M %p")
+        except ValueError:
+            _LOGGER.warning("Could not parse datetime: %s", last_reading)
+
+    return {
+        "current_usage": current_usage,
+        "daily_usage": daily_usage,
+        "last_reading": last_reading,
+        "last_reading_dt": last_reading_dt,
+        "reading_count": len(rows),
+    }
+
 
 class PlanoWaterAPI:
     """API client for Plano Water portal."""
@@ -30,12 +269,34 @@ class PlanoWaterAPI:
         self.session: aiohttp.ClientSession | None = None
         self.account_info: dict[str, Any] = {}
         self.meter_info: dict[str, Any] = {}
+        self.summary_html: bytes | None = None
+        self._last_login: float | None = None
+
+    @property
+    def login_expired(self) -> bool:
+        """Return True if a fresh login is needed before fetching data."""
+        return (
+            self.session is None
+            or self._last_login is None
+            or time.monotonic() - self._last_login > LOGIN_REFRESH_INTERVAL
+        )
 
     async def async_login(self) -> bool:
         """Login to the Plano Water portal."""
+        self.summary_html = None
+        self._last_login = None
         if self.session is None:
+            # Single-host client: keep a small pool of kept-alive connections
+            # and cache the DNS lookup between hourly updates
             self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
+                timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+                headers=REQUEST_HEADERS,
+                connector=aiohttp.TCPConnector(
+                    limit=2,
+                    limit_per_host=2,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=3600,
+                ),
             )
 
         try:
@@ -45,17 +306,14 @@ class PlanoWaterAPI:
                     _LOGGER.error("Failed to get login page: %s", response.status)
                     return False
                 
-                login_html = await response.text()
-                soup = BeautifulSoup(login_html, "html.parser")
+                login_html = await _async_read_html(response)
                 
                 # Extract form data
-                viewstate = soup.find("input", {"name": "__VIEWSTATE"})["value"]
-                viewstate_generator = soup.find("input", {"name": "__VIEWSTATEGENERATOR"})["value"]
-                event_validation = soup.find("input", {"name": "__EVENTVALIDATION"})["value"]
-                
-                # Find antiforgery token
-                antiforgery_input = soup.find("input", {"name": "ctl00$MainContent$antiforgery"})
-                antiforgery_token = antiforgery_input["value"] if antiforgery_input else ""
+                tokens = _extract_login_tokens(login_html)
+                viewstate = tokens["__VIEWSTATE"]
+                viewstate_generator = tokens["__VIEWSTATEGENERATOR"]
+                event_validation = tokens["__EVENTVALIDATION"]
+                antiforgery_token = tokens.get(_ANTIFORGERY_FIELD, "")
 
             # Prepare login form data
             form_data = {
@@ -82,9 +340,12 @@ class PlanoWaterAPI:
                     return False
                 
                 # Check if login was successful by looking for account info
-                content = await response.text()
-                if "Welcome," in content and "Account Number:" in content:
+                content = await response.read()
+                if b"Welcome," in content and b"Account Number:" in content:
                     _LOGGER.info("Successfully logged into Plano Water portal")
+                    # The login redirect lands on AccountSummary; keep it for reuse
+                    self.summary_html = content
+                    self._last_login = time.monotonic()
                     return True
                 else:
                     _LOGGER.error("Login failed - invalid credentials or page structure changed")
@@ -94,140 +355,83 @@ class PlanoWaterAPI:
             _LOGGER.exception("Error during login: %s", exc)
             return False
 
-    async def async_get_account_info(self) -> dict[str, Any]:
-        """Get account information from the portal."""
-        if not self.session:
-            if not await self.async_login():
-                return {}
-
-        try:
-            async with self.session.get(ACCOUNT_SUMMARY_URL) as response:
-                if response.status != 200:
-                    _LOGGER.error("Failed to get account summary: %s", response.status)
-                    return {}
-
-                content = await response.text()
-                soup = BeautifulSoup(content, "html.parser")
-
-                # Extract account information
-                account_summary = soup.find("span", {"id": "MainContent_lblAccountSummary"})
-                if not account_summary:
-                    return {}
+    async def _async_fetch_account_summary(self) -> bytes | None:
+        """Fetch the raw AccountSummary page bytes."""
+        async with self.session.get(ACCOUNT_SUMMARY_URL) as response:
+            if response.status != 200:
+                _LOGGER.error("Failed to get account summary: %s", response.status)
+                return None
 
-                account_text = account_summary.get_text()
-                
-                # Parse account number
-                account_match = re.search(r"Account Number:\s*(\d+)", account_text)
-                account_number = account_match.group(1) if account_match else ""
-
-                # Parse name
-                name_match = re.search(r"Name:\s*([^\n]+)", account_text)
-                name = name_match.group(1).strip() if name_match else ""
-
-                # Parse address
-                address_match = re.search(r"Address:\s*([^\n]+)", account_text)
-                address = address_match.group(1).strip() if address_match else ""
-
-                # Extract meter information
-                meter_select = soup.find("select", {"id": "MainContent_ddMeters"})
-                meter_id = ""
-                meter_number = ""
-                if meter_select:
-                    selected_option = meter_select.find("option", {"selected": "selected"})
-                    if selected_option:
-                        meter_id = selected_option.get("value", "")
-                        meter_number = selected_option.get_text().strip()
-
-                self.account_info = {
-                    "account_number": account_number,
-                    "name": name,
-                    "address": address,
-                    "meter_id": meter_id,
-                    "meter_number": meter_number,
-                }
-
-                return self.account_info
-
-        except Exception as exc:
-            _LOGGER.exception("Error getting account info: %s", exc)
-            return {}
+            _LOGGER.debug(
+                "Account summary Content-Encoding: %s",
+                response.headers.get("Content-Encoding", "identity"),
+            )
 
-    async def async_get_usage_data(self) -> dict[str, Any]:
-        """Get water usage data from the AccountSummary page."""
-        if not self.session:
+            # An expired auth cookie redirects back to the login page
+            if response.url.path.lower().startswith("/account/login"):
+                _LOGGER.debug("Portal session expired, login required")
+                self._last_login = None
+                return None
+
+            content = await response.read()
+
+            # A login form served in place of the page also means the session is gone
+            if _USAGE_SPAN_MARKER not in content:
+                _LOGGER.debug("Account summary has no usage data, login required")
+                self._last_login = None
+                return None
+
+            return content
+
+    async def async_get_account_and_usage(
+        self, prefetched_html: bytes | None = None
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Get account information and usage data from one AccountSummary page.
+
+        The page is fetched and parsed once and both extractors run on the
+        shared tree. If prefetched_html is given (e.g. the page returned by
+        the login redirect), it is parsed instead of fetching the page again.
+        """
+        content = prefetched_html
+        if content is None and not self.session:
             if not await self.async_login():
-                return {}
-
-        try:
-            async with self.session.get(ACCOUNT_SUMMARY_URL) as response:
-                if response.status != 200:
-                    _LOGGER.error("Failed to get account summary: %s", response.status)
-                    return {}
+                return {}, {}
+            content = self.summary_html
 
-                content = await response.text()
-                soup = BeautifulSoup(content, "html.parser")
+        # The page kept from the last login is consumed (or stale) after this
+        self.summary_html = None
 
-                # Find the usage table in the MainContent_lblReadDateTime span
-                usage_span = soup.find("span", {"id": "MainContent_lblReadDateTime"})
-                if not usage_span:
-                    _LOGGER.error("Could not find usage data span")
-                    return {}
+        try:
+            if content is None:
+                content = await self._async_fetch_account_summary()
+                if content is None:
+                    return {}, {}
 
-                # Find the table within the span
-                table = usage_span.find("table")
-                if not table:
-                    _LOGGER.error("Could not find usage table")
-                    return {}
+            doc = lxml_html.fromstring(content, parser=_HTML_PARSER)
 
-                _LOGGER.debug("Found usage table, parsing records")
-                
-                # Parse the table rows
-                usage_records = []
-                rows = table.find("tbody").find_all("tr") if table.find("tbody") else table.find_all("tr")[1:]  # Skip header
-                
-                for row in rows:
-                    cols = row.find_all("td")
-                    if len(cols) >= 3:
-                        date = cols[0].get_text().strip()
-                        time = cols[1].get_text().strip()
-                        usage = cols[2].get_text().strip()
-                        
-                        # Convert usage to float, handle non-numeric values
-                        try:
-                            usage_value = float(usage)
-                        except ValueError:
-                            usage_value = 0.0
-                        
-                        usage_records.append({
-                            "date": date,
-                            "time": time,
-                            "usage": usage_value,
-                            "datetime_str": f"{date} {time}"
-                        })
-
-                _LOGGER.info("Parsed %d usage records", len(usage_records))
-                    
-                # Calculate current and daily usage
-                current_usage = usage_records[0]["usage"] if usage_records else 0
-                
-                # Sum all available usage (represents recent usage)
-                daily_usage = sum(record["usage"] for record in usage_records)
-                
-                last_reading = None
-                if usage_records:
-                    last_reading = usage_records[0]["datetime_str"]
+            account_info = _extract_account(doc)
+            if account_info:
+                self.account_info = account_info
 
-                return {
-                    "current_usage": current_usage,
-                    "daily_usage": daily_usage,
-                    "last_reading": last_reading,
-                    "raw_data": usage_records,
-                }
+            return account_info, _extract_usage(content, doc)
 
         except Exception as exc:
-            _LOGGER.exception("Error getting usage data: %s", exc)
-            return {}
+            _LOGGER.exception("Error getting account summary data: %s", exc)
+            return {}, {}
+
+    async def async_get_account_info(
+        self, prefetched_html: bytes | None = None
+    ) -> dict[str, Any]:
+        """Get account information from the portal."""
+        account_info, _ = await self.async_get_account_and_usage(prefetched_html)
+        return account_info
 
+    async def async_get_usage_data(
+        self, prefetched_html: bytes | None = None
+    ) -> dict[str, Any]:
+        """Get water usage data from the AccountSummary page."""
+        _, usage_data = await self.async_get_account_and_usage(prefetched_html)
+        return usage_data
 
     async def async_close(self) -> None:
         """Close the session."""
@@ -30,7 +30,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     
     try:
         await api.async_login()
-        account_info = await api.async_get_account_info()
+        account_info = await api.async_get_account_info(api.summary_html)
         
         if not account_info:
             raise CannotConnect("Unable to retrieve account information")
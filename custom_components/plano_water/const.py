@@ -1,16 +1,25 @@
 """Constants for the Plano Water integration."""
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 
 DOMAIN = "plano_water"
 
 # Default values
 DEFAULT_SCAN_INTERVAL = 3600  # 1 hour in seconds
 DEFAULT_TIMEOUT = 30
+LOGIN_REFRESH_INTERVAL = 28800  # 8 hours in seconds
 
 # URLs
 BASE_URL = "https://cus.plano.gov"
 LOGIN_URL = f"{BASE_URL}/Account/Login"
 ACCOUNT_SUMMARY_URL = f"{BASE_URL}/AccountSummary"
 
+# Sent with every portal request; compressed responses are inflated by aiohttp
+REQUEST_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "HomeAssistant PlanoWater/1.0",
+}
+
 # Configuration keys
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
@@ -39,4 +48,19 @@ SENSOR_TYPES = {
         "device_class": "timestamp",
         "state_class": None,
     },
-}
\ No newline at end of file
+}
+
+# SENSOR_TYPES with the entity name and HA enum classes resolved once at import
+RESOLVED_SENSOR_TYPES = {
+    sensor_type: {
+        **config,
+        "entity_name": f"Plano Water {config['name']}",
+        "device_class_obj": (
+            SensorDeviceClass(config["device_class"]) if config["device_class"] else None
+        ),
+        "state_class_obj": (
+            SensorStateClass(config["state_class"]) if config["state_class"] else None
+        ),
+    }
+    for sensor_type, config in SENSOR_TYPES.items()
+}
@@ -35,18 +35,27 @@ class PlanoWaterDataUpdateCoordinator(DataUpdateCoordinator):
     async def _async_update_data(self):
         """Update data via library."""
         try:
-            # Ensure we're logged in
-            if not await self.api.async_login():
-                raise UpdateFailed("Failed to login to Plano Water portal")
+            # Reuse the session cookies and only log in when needed
+            summary_html = None
+            if self.api.login_expired:
+                if not await self.api.async_login():
+                    raise UpdateFailed("Failed to login to Plano Water portal")
+                # The login redirect already returned the AccountSummary page
+                summary_html = self.api.summary_html
 
-            # Get account info if not already cached
+            # Account info and usage both come from the same AccountSummary page
+            _, usage_data = await self.api.async_get_account_and_usage(
+                summary_html
+            )
+            if not usage_data and summary_html is None and self.api.login_expired:
+                # The portal session expired server-side; log in and retry once
+                if not await self.api.async_login():
+                    raise UpdateFailed("Failed to login to Plano Water portal")
+                _, usage_data = await self.api.async_get_account_and_usage(
+                    self.api.summary_html
+                )
             if not self.api.account_info:
-                account_info = await self.api.async_get_account_info()
-                if not account_info:
-                    raise UpdateFailed("Failed to get account information")
-
-            # Get usage data from AccountSummary page
-            usage_data = await self.api.async_get_usage_data()
+                raise UpdateFailed("Failed to get account information")
             if not usage_data:
                 raise UpdateFailed("Failed to get usage data from AccountSummary page")
 
@@ -5,17 +5,13 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from homeassistant.components.sensor import (
-    SensorDeviceClass,
-    SensorEntity,
-    SensorStateClass,
-)
+from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, SENSOR_TYPES
+from .const import DOMAIN, RESOLVED_SENSOR_TYPES, SENSOR_TYPES
 from .coordinator import PlanoWaterDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,25 +43,22 @@ class PlanoWaterSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.sensor_type = sensor_type
-        self.sensor_config = SENSOR_TYPES[sensor_type]
+        self.sensor_config = RESOLVED_SENSOR_TYPES[sensor_type]
         
         account_number = ""
         if coordinator.data and "account_info" in coordinator.data:
             account_number = coordinator.data["account_info"].get("account_number", "")
         
-        self._attr_name = f"Plano Water {self.sensor_config['name']}"
+        self._attr_name = self.sensor_config["entity_name"]
         self._attr_unique_id = f"plano_water_{account_number}_{sensor_type}"
         self._attr_native_unit_of_measurement = self.sensor_config["unit"]
         self._attr_icon = self.sensor_config["icon"]
         
-        if self.sensor_config["device_class"]:
-            if self.sensor_config["device_class"] == "timestamp":
-                self._attr_device_class = SensorDeviceClass.TIMESTAMP
-            else:
-                self._attr_device_class = getattr(SensorDeviceClass, self.sensor_config["device_class"].upper())
+        if self.sensor_config["device_class_obj"]:
+            self._attr_device_class = self.sensor_config["device_class_obj"]
             
-        if self.sensor_config["state_class"]:
-            self._attr_state_class = getattr(SensorStateClass, self.sensor_config["state_class"].upper())
+        if self.sensor_config["state_class_obj"]:
+            self._attr_state_class = self.sensor_config["state_class_obj"]
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -95,17 +88,8 @@ class PlanoWaterSensor(CoordinatorEntity, SensorEntity):
         elif self.sensor_type == "daily_usage":
             return usage_data.get("daily_usage", 0)
         elif self.sensor_type == "last_reading":
-            last_reading = usage_data.get("last_reading")
-            if last_reading:
-                try:
-                    # Parse the datetime string from the format: "11/26/24 3:00 AM"
-                    date_obj = datetime.strptime(last_reading, "%m/%d/%y %I:%M %p")
-                    # Return as datetime object for timestamp device class
-                    return date_obj
-                except ValueError:
-                    _LOGGER.warning("Could not parse datetime: %s", last_reading)
-                    return None
-            return None
+            # Parsed once per update by the API; datetime object for timestamp device class
+            return usage_data.get("last_reading_dt")
 
         return None
 
@@ -129,7 +113,7 @@ class PlanoWaterSensor(CoordinatorEntity, SensorEntity):
         if self.sensor_type == "current_usage":
             attributes["last_reading_date"] = usage_data.get("last_reading")
         elif self.sensor_type == "daily_usage":
-            attributes["reading_count"] = len(usage_data.get("raw_data", []))
+            attributes["reading_count"] = usage_data.get("reading_count", 0)
         
         return attributes
 